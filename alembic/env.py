@@ -6,7 +6,7 @@ from logging.config import fileConfig
 
 from dotenv import load_dotenv
 from sqlalchemy import pool, text
-from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Connection, make_url
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
@@ -55,6 +55,8 @@ def run_migrations_offline() -> None:
     script output.
     """
     url = config.get_main_option("sqlalchemy.url")
+    # Migrations branch on the dialect via _is_sqlite(); record it once for all of them
+    config.attributes["dialect_name"] = make_url(url).get_backend_name()
     context.configure(
         url=url,
         target_metadata=target_metadata,
@@ -77,6 +79,9 @@ def do_run_migrations(connection: Connection) -> None:
     connection.execute(text("CREATE SCHEMA IF NOT EXISTS audit"))
     connection.commit()
 
+    # Migrations branch on the dialect via _is_sqlite(); record it once for all of them
+    config.attributes["dialect_name"] = connection.dialect.name
+
     context.configure(
         connection=connection,
         target_metadata=target_metadata,
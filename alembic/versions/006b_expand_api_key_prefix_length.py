@@ -10,7 +10,7 @@ from collections.abc import Sequence
 
 import sqlalchemy as sa
 
-from alembic import op
+from alembic import context, op
 
 # revision identifiers, used by Alembic.
 revision: str = "006b"
@@ -20,9 +20,8 @@ depends_on: str | Sequence[str] | None = None
 
 
 def _is_sqlite() -> bool:
-    """Check if we're running against SQLite."""
-    bind = op.get_bind()
-    return bind.dialect.name == "sqlite"
+    """Check if we're running against SQLite (dialect recorded once by env.py)."""
+    return context.config.attributes["dialect_name"] == "sqlite"
 
 
 def upgrade() -> None:
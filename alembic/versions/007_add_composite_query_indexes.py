@@ -11,7 +11,7 @@ These indexes optimize frequently-used query patterns:
 
 from collections.abc import Sequence
 
-from alembic import op
+from alembic import context, op
 
 # revision identifiers, used by Alembic.
 revision: str = "007"
@@ -21,9 +21,8 @@ depends_on: str | Sequence[str] | None = None
 
 
 def _is_sqlite() -> bool:
-    """Check if we're running against SQLite."""
-    bind = op.get_bind()
-    return bind.dialect.name == "sqlite"
+    """Check if we're running against SQLite (dialect recorded once by env.py)."""
+    return context.config.attributes["dialect_name"] == "sqlite"
 
 
 def upgrade() -> None:
@@ -15,7 +15,7 @@ PostgreSQL only — SQLite uses VARCHAR for enums so no migration is needed.
 
 from collections.abc import Sequence
 
-from alembic import op
+from alembic import context, op
 
 # revision identifiers, used by Alembic.
 revision: str = "015"
@@ -25,9 +25,8 @@ depends_on: str | Sequence[str] | None = None
 
 
 def _is_sqlite() -> bool:
-    """Check if we're running against SQLite."""
-    bind = op.get_bind()
-    return bind.dialect.name == "sqlite"
+    """Check if we're running against SQLite (dialect recorded once by env.py)."""
+    return context.config.attributes["dialect_name"] == "sqlite"
 
 
 def upgrade() -> None:
@@ -36,6 +35,8 @@ def upgrade() -> None:
         # SQLite stores enums as VARCHAR — no schema change needed.
         return
 
+    # Separate statements: the asyncpg dialect prepares every statement, and a
+    # prepared statement can't hold more than one command.
     op.execute("ALTER TYPE proposalstatus ADD VALUE IF NOT EXISTS 'published' AFTER 'approved'")
     op.execute(
         "ALTER TYPE webhookdeliverystatus ADD VALUE IF NOT EXISTS 'dead_lettered' AFTER 'failed'"
@@ -152,12 +152,10 @@ async def get_auth_context(
     # This is done inline rather than with a decorator because dependencies
     # need manual rate limit checking
     if settings.rate_limit_enabled:
-        from limits import parse
+        from tessera.api.rate_limit import get_rate_limit_key, limiter, parse_rate_limit
 
-        from tessera.api.rate_limit import get_rate_limit_key, limiter
-
-        # Parse the rate limit string into a RateLimitItem
-        rate_limit_item = parse(settings.rate_limit_auth)
+        # Parse the rate limit string into a RateLimitItem (cached per string)
+        rate_limit_item = parse_rate_limit(settings.rate_limit_auth)
 
         # Get the rate limit key (per-API-key or per-IP)
         limit_key = get_rate_limit_key(request)
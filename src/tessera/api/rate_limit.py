@@ -10,11 +10,12 @@ and lineage analysis to prevent a team from monopolizing resources.
 
 import hashlib
 from collections.abc import Awaitable, Callable
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import ParamSpec, TypeVar
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
+from limits import RateLimitItem, parse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
@@ -50,6 +51,16 @@ def get_rate_limit_key(request: Request) -> str:
     return get_remote_address(request)
 
 
+@lru_cache(maxsize=32)
+def parse_rate_limit(limit_string: str) -> RateLimitItem:
+    """Parse a rate limit string (e.g. "30/minute") into a RateLimitItem.
+
+    Cached by string value, so a limit changed at runtime is simply parsed
+    again rather than served stale.
+    """
+    return parse(limit_string)
+
+
 def get_team_rate_limit_key(request: Request) -> str:
     """Get a rate limit key based on the authenticated team.
 
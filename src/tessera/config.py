@@ -1,19 +1,40 @@
 """Application configuration."""
 
-from pydantic import Field, field_validator, model_validator
+from collections.abc import Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Any
+
+from pydantic import BeforeValidator, Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Default session secret - MUST be overridden in production
 DEFAULT_SESSION_SECRET = "tessera-dev-secret-key-change-in-production"
 
+# Resolved once at import; when there is no .env file (the common case in
+# containers) the dotenv source is skipped entirely.
+_ENV_FILE = Path(".env")
+
+
+def _parse_csv_list(v: str | Sequence[str]) -> Sequence[str]:
+    """Split a comma-separated string into stripped, non-empty items; pass sequences through."""
+    if isinstance(v, str):
+        return tuple(item.strip() for item in v.split(",") if item.strip())
+    return v
+
+
+# Accepts a JSON list or a comma-separated string; coercion is attached to the type
+CsvList = Annotated[tuple[str, ...], BeforeValidator(_parse_csv_list)]
+
 
 class Settings(BaseSettings):  # type: ignore[misc]
     """Application settings loaded from environment variables."""
 
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=_ENV_FILE if _ENV_FILE.exists() else None,
         env_file_encoding="utf-8",
         env_prefix="",  # No prefix, use exact names
+        extra="ignore",  # Unrelated keys in .env (e.g. POSTGRES_*) are not errors
     )
 
     # ── Environment ──────────────────────────────────────────────
@@ -24,6 +45,11 @@ class Settings(BaseSettings):  # type: ignore[misc]
         "and middleware behavior. Values: development, test, production.",
     )
 
+    @property
+    def is_production(self) -> bool:
+        """Whether ENVIRONMENT is production (derived, so it can't drift on assignment)."""
+        return self.environment == "production"
+
     # ── Logging ──────────────────────────────────────────────────
 
     log_level: str = Field(
@@ -51,29 +77,21 @@ class Settings(BaseSettings):  # type: ignore[misc]
 
     # ── CORS ─────────────────────────────────────────────────────
 
-    cors_origins: list[str] = Field(
-        default=[
+    cors_origins: CsvList = Field(
+        default=(
             "http://localhost:3000",
             "http://localhost:5173",
             "http://127.0.0.1:3000",
             "http://127.0.0.1:5173",
-        ],
+        ),
         description="Allowed CORS origins. Accepts a JSON list or comma-separated string.",
     )
-    cors_allow_methods: list[str] = Field(
-        default=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
+    cors_allow_methods: tuple[str, ...] = Field(
+        default=("GET", "POST", "PATCH", "DELETE", "OPTIONS"),
         description="Allowed HTTP methods for CORS. "
         "In production, restricted to this list; in dev, allows all.",
     )
 
-    @field_validator("cors_origins", mode="before")
-    @classmethod
-    def parse_cors_origins(cls, v: str | list[str]) -> list[str]:
-        """Parse CORS origins from comma-separated string or list."""
-        if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",") if origin.strip()]
-        return v
-
     # ── Webhooks ─────────────────────────────────────────────────
 
     webhook_url: str | None = Field(
@@ -85,8 +103,8 @@ class Settings(BaseSettings):  # type: ignore[misc]
         description="HMAC secret for signing webhook payloads. "
         "Recipients verify signatures to authenticate events.",
     )
-    webhook_allowed_domains: list[str] = Field(
-        default=[],
+    webhook_allowed_domains: CsvList = Field(
+        default=(),
         description="Allowlist of domains for webhook URLs. "
         "Empty list allows all domains. Comma-separated string or JSON list.",
     )
@@ -95,14 +113,6 @@ class Settings(BaseSettings):  # type: ignore[misc]
         description="DNS resolution timeout in seconds for webhook URL validation.",
     )
 
-    @field_validator("webhook_allowed_domains", mode="before")
-    @classmethod
-    def parse_webhook_allowed_domains(cls, v: str | list[str]) -> list[str]:
-        """Parse webhook allowed domains from comma-separated string or list."""
-        if isinstance(v, str):
-            return [domain.strip() for domain in v.split(",") if domain.strip()]
-        return v
-
     # ── Slack ────────────────────────────────────────────────────
 
     slack_webhook_url: str | None = Field(
@@ -323,7 +333,7 @@ class Settings(BaseSettings):  # type: ignore[misc]
                 'Generate one with: python -c "import secrets; print(secrets.token_hex(32))"'
             )
 
-        if self.environment != "production":
+        if not self.is_production:
             return self
 
         errors: list[str] = []
@@ -357,4 +367,18 @@ class Settings(BaseSettings):  # type: ignore[misc]
         return self
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance, building it on first use."""
+    return Settings()
+
+
+if TYPE_CHECKING:
+    settings: Settings
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``settings`` lazily so importing this module doesn't read the environment."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,17 +11,51 @@ Usage:
     configure_logging()
 """
 
-import json
+import atexit
+import copy
 import logging
+import queue
 import sys
-from datetime import UTC, datetime
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import TextIO
+
+import orjson
+
+# Third-party loggers that are too chatty at INFO
+_QUIET_LOGGERS = ("uvicorn.access", "httpx", "httpcore")
+
+# Quiet them as soon as this module is imported (main.py imports it at startup),
+# so records they emit before the lifespan hook runs configure_logging() are
+# dropped too. configure_logging() applies the same level again.
+for _name in _QUIET_LOGGERS:
+    logging.getLogger(_name).setLevel(logging.WARNING)
+
+# (whole second, formatted "YYYY-MM-DDTHH:MM:SS") of the last record. Stored as one
+# tuple so threads never observe a second paired with another second's string.
+_timestamp_cache: tuple[int, str] = (0, "")
+
+
+def _format_timestamp(created: float) -> str:
+    """Format a record's creation time as ISO 8601 UTC with millisecond precision.
+
+    Log lines arrive in bursts within the same second, so the date/time part is
+    only rebuilt when the second changes.
+    """
+    global _timestamp_cache
+    sec = int(created)
+    cached_sec, prefix = _timestamp_cache
+    if sec != cached_sec or not prefix:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _timestamp_cache = (sec, prefix)
+    return f"{prefix}.{int((created - sec) * 1000):03d}Z"
 
 
 class JSONFormatter(logging.Formatter):
     """Formats log records as single-line JSON objects.
 
     Output fields:
-        timestamp: ISO 8601 UTC timestamp
+        timestamp: ISO 8601 UTC timestamp with millisecond precision
         level: Log level name (INFO, WARNING, ERROR, etc.)
         logger: Logger name (dotted module path)
         message: Formatted log message
@@ -29,47 +63,210 @@ class JSONFormatter(logging.Formatter):
     """
 
     def format(self, record: logging.LogRecord) -> str:
+        return orjson.dumps(self._log_entry(record), default=str).decode()
+
+    def format_line(self, record: logging.LogRecord) -> bytes:
+        """Serialize the record as a newline-terminated UTF-8 line.
+
+        orjson already produces bytes, so handlers writing to a binary stream use
+        this to skip the decode in format() and their own encode.
+        """
+        return orjson.dumps(self._log_entry(record), default=str, option=orjson.OPT_APPEND_NEWLINE)
+
+    def _log_entry(self, record: logging.LogRecord) -> dict[str, str | int | float]:
         log_entry: dict[str, str | int | float] = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": _format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
         if record.exc_info and record.exc_info[1] is not None:
-            log_entry["exc_info"] = self.formatException(record.exc_info)
+            # Reuse the traceback text if another handler already formatted it
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_entry["exc_info"] = record.exc_text
 
-        return json.dumps(log_entry, default=str)
+        return log_entry
+
+
+# Pending output size at which JSONStreamHandler writes without waiting for a flush
+_FLUSH_BYTES = 64 * 1024
+
+
+class JSONStreamHandler(logging.StreamHandler[TextIO]):
+    """Writes formatted records to the stream's binary buffer in batches.
+
+    Skips the text layer (TextIOWrapper encoding and line-buffer handling) that
+    StreamHandler.emit goes through; with a JSONFormatter the line is taken as
+    bytes straight from orjson, with no str round-trip. Encoded lines are held
+    in memory and written with a single call when the handler is flushed: by the
+    queue listener once the queue is drained, immediately for ERROR and above,
+    or once _FLUSH_BYTES are pending. Streams without a binary buffer, such as
+    io.StringIO, fall back to a plain text write.
+    """
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        super().__init__(stream)
+        self._pending: list[bytes] = []
+        self._pending_size = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if isinstance(self.formatter, JSONFormatter):
+                data = self.formatter.format_line(record)
+            else:
+                data = self.format(record).encode() + b"\n"
+            self._pending.append(data)
+            self._pending_size += len(data)
+            if record.levelno >= logging.ERROR or self._pending_size >= _FLUSH_BYTES:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self._pending:
+                data = b"".join(self._pending)
+                self._pending.clear()
+                self._pending_size = 0
+                buffer = getattr(self.stream, "buffer", None)
+                if buffer is None:
+                    self.stream.write(data.decode())
+                else:
+                    buffer.write(data)
+            super().flush()
+        finally:
+            self.release()
+
+
+class _QueueHandler(QueueHandler):
+    """Hands records to the listener thread without rendering them first.
+
+    The stdlib prepare() formats the record on the calling thread and folds the
+    traceback into msg, which would leave JSONFormatter no exc_info to emit as its
+    own field. Only msg % args is resolved here, so later mutation of the args
+    can't change what gets logged; everything else is formatted by the terminal
+    handler on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _QueueListener(QueueListener):
+    """Flushes the handlers each time the queue runs empty.
+
+    Handlers may batch output (see JSONStreamHandler); a burst of records is then
+    written together, while a lone record is still written as soon as it's handled.
+    A failed flush goes to the handler's handleError(); the batch it held is lost,
+    but the thread keeps draining the queue.
+    """
+
+    queue: "queue.SimpleQueue[logging.LogRecord]"
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                try:
+                    handler.flush()
+                except Exception:
+                    # Report it like a failed emit; an exception escaping here
+                    # would end the listener thread and strand every later record.
+                    handler.handleError(record)
+
+
+# Background thread that drains the queue into the terminal handler; replaced
+# (and stopped) each time configure_logging() runs.
+_listener: _QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    """Stop the active listener, writing out any records still queued."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                # The stream may already be closed at interpreter exit
+                # (logging.shutdown() ignores the same errors)
+                pass
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+# Formatters hold no per-record state, so one instance of each is shared by every
+# handler configure_logging() installs.
+_TEXT_FORMATTER = logging.Formatter(
+    "%(asctime)s %(levelname)-8s %(name)s  %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+_JSON_FORMATTER = JSONFormatter()
 
 
 def configure_logging(level: str = "INFO", fmt: str = "text") -> None:
     """Configure root logger with the specified format and level.
 
+    Also switches off caller and thread/process lookup for the whole process
+    (logging._srcfile, logThreads, logProcesses, logMultiprocessing): records
+    from every logger then carry no filename/lineno/funcName, and stack_info=True
+    is ignored.
+
     Args:
         level: Log level name (DEBUG, INFO, WARNING, ERROR, CRITICAL).
         fmt: Output format — 'text' for human-readable, 'json' for structured.
     """
+    global _listener
     root = logging.getLogger()
 
     # Clear existing handlers to prevent duplicate output
     root.handlers.clear()
+    _stop_listener()
 
-    handler = logging.StreamHandler(sys.stderr)
-
+    terminal: logging.StreamHandler[TextIO]
     if fmt == "json":
-        handler.setFormatter(JSONFormatter())
+        terminal = JSONStreamHandler(sys.stderr)
+        terminal.setFormatter(_JSON_FORMATTER)
     else:
-        handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s %(levelname)-8s %(name)s  %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-        )
+        terminal = logging.StreamHandler(sys.stderr)
+        terminal.setFormatter(_TEXT_FORMATTER)
 
+    # Callers only enqueue records; formatting and the stderr write happen on
+    # the listener thread, so a slow stream never blocks a request.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    handler = _QueueHandler(log_queue)
+    _listener = _QueueListener(log_queue, terminal, respect_handler_level=True)
+    _listener.start()
+
+    # Resolve the level name once so the root logger and handlers share the same integer
+    numeric_level = logging.getLevelNamesMapping().get(level.upper(), logging.INFO)
+    handler.setLevel(numeric_level)
+    terminal.setLevel(numeric_level)
     root.addHandler(handler)
-    root.setLevel(level.upper())
+    root.setLevel(numeric_level)
+
+    # Neither format renders caller location or thread/process info, so skip
+    # collecting them per record (no sys._getframe() walk in findCaller()).
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
-    # Quiet noisy third-party loggers
-    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
+    # Quiet noisy third-party loggers. They get the handler directly and stop
+    # propagating, so their records don't walk up the logger hierarchy.
+    for name in _QUIET_LOGGERS:
+        quiet = logging.getLogger(name)
+        quiet.setLevel(logging.WARNING)
+        quiet.propagate = False
+        quiet.handlers = [handler]
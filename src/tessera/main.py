@@ -2,7 +2,7 @@
 
 import logging
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
@@ -126,15 +126,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     configure_logging(level=settings.log_level, fmt=settings.log_format)
 
     # Security warnings
-    if (
-        settings.environment == "production"
-        and settings.session_secret_key == DEFAULT_SESSION_SECRET
-    ):
+    if settings.is_production and settings.session_secret_key == DEFAULT_SESSION_SECRET:
         logger.warning(
             "SECURITY WARNING: Using default session secret key in production! "
             "Set SESSION_SECRET_KEY environment variable to a secure random value."
         )
-    if settings.environment == "production" and settings.auth_disabled:
+    if settings.is_production and settings.auth_disabled:
         logger.warning(
             "SECURITY WARNING: Authentication is disabled in production! "
             "Set AUTH_DISABLED=false for production deployments."
@@ -175,8 +172,8 @@ app.add_middleware(SecurityHeadersMiddleware, environment=settings.environment)
 app.add_middleware(MetricsMiddleware)
 
 # CORS middleware
-allow_methods = ["*"]
-if settings.environment == "production":
+allow_methods: Sequence[str] = ("*",)
+if settings.is_production:
     allow_methods = settings.cors_allow_methods
 
 app.add_middleware(
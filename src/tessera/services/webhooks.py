@@ -211,7 +211,7 @@ async def validate_webhook_url(url: str) -> tuple[bool, str]:
         parsed = urlparse(url)
 
         # Require HTTPS in production
-        if settings.environment == "production" and parsed.scheme != "https":
+        if settings.is_production and parsed.scheme != "https":
             return False, "Webhook URL must use HTTPS in production"
 
         # Must have a valid scheme
@@ -223,9 +223,9 @@ async def validate_webhook_url(url: str) -> tuple[bool, str]:
             return False, "Webhook URL must have a hostname"
 
         # Optional allowlist check (exact match or subdomain)
-        allowed_domains = getattr(settings, "webhook_allowed_domains", [])
-        if not isinstance(allowed_domains, list):
-            allowed_domains = []
+        allowed_domains = getattr(settings, "webhook_allowed_domains", ())
+        if not isinstance(allowed_domains, list | tuple):
+            allowed_domains = ()
         if allowed_domains:
             hostname = parsed.hostname.lower().rstrip(".")
             allowed = [d.lower().rstrip(".") for d in allowed_domains]
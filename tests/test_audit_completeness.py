@@ -4,11 +4,12 @@ These tests perform operations through the API and then verify the corresponding
 audit events exist in the database with correct action, actor, and payload.
 """
 
+from typing import Any
 from uuid import UUID
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tessera.db import AuditEventDB
@@ -16,15 +17,30 @@ from tessera.db import AuditEventDB
 pytestmark = pytest.mark.asyncio
 
 
-async def _get_audit_events(
-    session: AsyncSession, action: str, entity_id: UUID | None = None
-) -> list[AuditEventDB]:
-    """Fetch audit events by action and optionally entity_id."""
-    query = select(AuditEventDB).where(AuditEventDB.action == action)
+def _audit_event_filter(action: str, entity_id: str | None) -> list[ColumnElement[bool]]:
+    """WHERE clauses matching audit events by action and optionally entity_id."""
+    clauses = [AuditEventDB.action == action]
     if entity_id is not None:
-        query = query.where(AuditEventDB.entity_id == entity_id)
-    result = await session.execute(query)
-    return list(result.scalars().all())
+        clauses.append(AuditEventDB.entity_id == UUID(entity_id))
+    return clauses
+
+
+async def _count_audit_events(
+    session: AsyncSession, action: str, entity_id: str | None = None
+) -> int:
+    """Count audit events by action and optionally entity_id."""
+    query = select(func.count()).select_from(AuditEventDB)
+    count = await session.scalar(query.where(*_audit_event_filter(action, entity_id)))
+    return count or 0
+
+
+async def _one_audit_event(
+    session: AsyncSession, action: str, entity_id: str | None = None
+) -> Row[tuple[str, UUID | None, dict[str, Any]]]:
+    """Fetch the asserted columns of one audit event by action and optionally entity_id."""
+    query = select(AuditEventDB.entity_type, AuditEventDB.actor_id, AuditEventDB.payload)
+    result = await session.execute(query.where(*_audit_event_filter(action, entity_id)).limit(1))
+    return result.one()
 
 
 class TestRestoreAuditEvents:
@@ -41,7 +57,7 @@ class TestRestoreAuditEvents:
             "/api/v1/assets",
             json={"fqn": "db.schema.audit_restore_test", "owner_team_id": team_id},
         )
-        asset_id = UUID(asset_resp.json()["id"])
+        asset_id = asset_resp.json()["id"]
 
         # Delete the asset
         await client.delete(f"/api/v1/assets/{asset_id}")
@@ -51,17 +67,17 @@ class TestRestoreAuditEvents:
         assert resp.status_code == 200
 
         # Verify audit event
-        events = await _get_audit_events(test_session, "asset.restored", asset_id)
-        assert len(events) == 1
-        assert events[0].entity_type == "asset"
-        assert events[0].payload["fqn"] == "db.schema.audit_restore_test"
+        assert await _count_audit_events(test_session, "asset.restored", asset_id) == 1
+        event = await _one_audit_event(test_session, "asset.restored", asset_id)
+        assert event.entity_type == "asset"
+        assert event.payload["fqn"] == "db.schema.audit_restore_test"
 
     async def test_restore_team_creates_audit_event(
         self, client: AsyncClient, test_session: AsyncSession
     ):
         # Create and delete team
         team_resp = await client.post("/api/v1/teams", json={"name": "audit-team-restore"})
-        team_id = UUID(team_resp.json()["id"])
+        team_id = team_resp.json()["id"]
 
         await client.delete(f"/api/v1/teams/{team_id}?force=true")
 
@@ -70,10 +86,10 @@ class TestRestoreAuditEvents:
         assert resp.status_code == 200
 
         # Verify audit event
-        events = await _get_audit_events(test_session, "team.restored", team_id)
-        assert len(events) == 1
-        assert events[0].entity_type == "team"
-        assert events[0].payload["name"] == "audit-team-restore"
+        assert await _count_audit_events(test_session, "team.restored", team_id) == 1
+        event = await _one_audit_event(test_session, "team.restored", team_id)
+        assert event.entity_type == "team"
+        assert event.payload["name"] == "audit-team-restore"
 
     async def test_reactivate_user_creates_audit_event(
         self, client: AsyncClient, test_session: AsyncSession
@@ -91,7 +107,7 @@ class TestRestoreAuditEvents:
                 "team_id": team_id,
             },
         )
-        user_id = UUID(user_resp.json()["id"])
+        user_id = user_resp.json()["id"]
 
         await client.delete(f"/api/v1/users/{user_id}")
 
@@ -100,11 +116,11 @@ class TestRestoreAuditEvents:
         assert resp.status_code == 200
 
         # Verify audit event
-        events = await _get_audit_events(test_session, "user.reactivated", user_id)
-        assert len(events) == 1
-        assert events[0].entity_type == "user"
-        assert events[0].payload["email"] == "audit-reactivate@test.com"
-        assert events[0].payload["name"] == "Audit Reactivate"
+        assert await _count_audit_events(test_session, "user.reactivated", user_id) == 1
+        event = await _one_audit_event(test_session, "user.reactivated", user_id)
+        assert event.entity_type == "user"
+        assert event.payload["email"] == "audit-reactivate@test.com"
+        assert event.payload["name"] == "Audit Reactivate"
 
 
 class TestProposalAuditEvents:
@@ -162,17 +178,17 @@ class TestProposalAuditEvents:
             },
         )
         assert resp.json()["action"] == "proposal_created"
-        proposal_id = UUID(resp.json()["proposal"]["id"])
+        proposal_id = resp.json()["proposal"]["id"]
 
         # Withdraw the proposal
         resp = await client.post(f"/api/v1/proposals/{proposal_id}/withdraw")
         assert resp.status_code == 200
 
         # Verify audit event
-        events = await _get_audit_events(test_session, "proposal.withdrawn", proposal_id)
-        assert len(events) == 1
-        assert events[0].entity_type == "proposal"
-        assert events[0].payload["asset_id"] == asset_id
+        assert await _count_audit_events(test_session, "proposal.withdrawn", proposal_id) == 1
+        event = await _one_audit_event(test_session, "proposal.withdrawn", proposal_id)
+        assert event.entity_type == "proposal"
+        assert event.payload["asset_id"] == asset_id
 
     async def test_file_objection_creates_audit_event(
         self, client: AsyncClient, test_session: AsyncSession
@@ -242,21 +258,21 @@ class TestProposalAuditEvents:
             },
         )
         assert resp.json()["action"] == "proposal_created"
-        proposal_id = UUID(resp.json()["proposal"]["id"])
+        proposal_id = resp.json()["proposal"]["id"]
 
         # File objection
         resp = await client.post(
-            f"/api/v1/proposals/{proposal_id}/object" f"?objector_team_id={consumer_id}",
+            f"/api/v1/proposals/{proposal_id}/object?objector_team_id={consumer_id}",
             json={"reason": "We need migration time"},
         )
         assert resp.status_code == 201
 
         # Verify audit event
-        events = await _get_audit_events(test_session, "proposal.objection_filed", proposal_id)
-        assert len(events) == 1
-        assert events[0].entity_type == "proposal"
-        assert events[0].actor_id == UUID(consumer_id)
-        assert events[0].payload["reason"] == "We need migration time"
+        assert await _count_audit_events(test_session, "proposal.objection_filed", proposal_id) == 1
+        event = await _one_audit_event(test_session, "proposal.objection_filed", proposal_id)
+        assert event.entity_type == "proposal"
+        assert str(event.actor_id) == consumer_id
+        assert event.payload["reason"] == "We need migration time"
 
 
 class TestBulkAuditEvents:
@@ -267,7 +283,7 @@ class TestBulkAuditEvents:
     ):
         # Create source and target teams
         source_resp = await client.post("/api/v1/teams", json={"name": "audit-reassign-source"})
-        source_id = UUID(source_resp.json()["id"])
+        source_id = source_resp.json()["id"]
 
         target_resp = await client.post("/api/v1/teams", json={"name": "audit-reassign-target"})
         target_id = target_resp.json()["id"]
@@ -275,11 +291,11 @@ class TestBulkAuditEvents:
         # Create assets in source team
         await client.post(
             "/api/v1/assets",
-            json={"fqn": "db.schema.audit_reassign_1", "owner_team_id": str(source_id)},
+            json={"fqn": "db.schema.audit_reassign_1", "owner_team_id": source_id},
         )
         await client.post(
             "/api/v1/assets",
-            json={"fqn": "db.schema.audit_reassign_2", "owner_team_id": str(source_id)},
+            json={"fqn": "db.schema.audit_reassign_2", "owner_team_id": source_id},
         )
 
         # Reassign all assets
@@ -291,13 +307,13 @@ class TestBulkAuditEvents:
         assert resp.json()["reassigned"] == 2
 
         # Verify audit event
-        events = await _get_audit_events(test_session, "bulk.assets_reassigned", source_id)
-        assert len(events) == 1
-        assert events[0].entity_type == "team"
-        assert events[0].payload["source_team_id"] == str(source_id)
-        assert events[0].payload["target_team_id"] == target_id
-        assert events[0].payload["asset_count"] == 2
-        assert len(events[0].payload["asset_ids"]) == 2
+        assert await _count_audit_events(test_session, "bulk.assets_reassigned", source_id) == 1
+        event = await _one_audit_event(test_session, "bulk.assets_reassigned", source_id)
+        assert event.entity_type == "team"
+        assert event.payload["source_team_id"] == source_id
+        assert event.payload["target_team_id"] == target_id
+        assert event.payload["asset_count"] == 2
+        assert len(event.payload["asset_ids"]) == 2
 
     async def test_bulk_assign_owner_creates_audit_event(
         self, client: AsyncClient, test_session: AsyncSession
@@ -332,8 +348,8 @@ class TestBulkAuditEvents:
         assert resp.json()["updated"] == 2
 
         # Verify audit event
-        events = await _get_audit_events(test_session, "bulk.owner_assigned")
-        matching = [e for e in events if e.payload.get("asset_count") == 2]
-        assert len(matching) == 1
-        assert matching[0].payload["new_owner_user_id"] == user_id
-        assert len(matching[0].payload["asset_ids"]) == 2
+        assert await _count_audit_events(test_session, "bulk.owner_assigned") == 1
+        event = await _one_audit_event(test_session, "bulk.owner_assigned")
+        assert event.payload["asset_count"] == 2
+        assert event.payload["new_owner_user_id"] == user_id
+        assert len(event.payload["asset_ids"]) == 2
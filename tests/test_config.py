@@ -0,0 +1,81 @@
+"""Tests for application settings."""
+
+import os
+
+import pytest
+
+import tessera.config as config
+from tessera.config import Settings, get_settings
+
+
+class TestSettingsSingleton:
+    """Tests for lazy construction of the module-level settings."""
+
+    def test_settings_attribute_is_cached_instance(self) -> None:
+        assert config.settings is get_settings()
+        assert isinstance(config.settings, Settings)
+
+    def test_unknown_attribute_raises(self) -> None:
+        with pytest.raises(AttributeError):
+            config.not_a_setting
+
+
+class TestEnvFile:
+    """Tests for .env file handling."""
+
+    def test_unrelated_env_file_keys_are_ignored(self, tmp_path) -> None:
+        env_file = tmp_path / ".env"
+        env_file.write_text("API_PORT=8000\nLOG_FORMAT=json\n")
+
+        settings = Settings(_env_file=env_file)
+        assert settings.log_format == "json"
+        assert not hasattr(settings, "api_port")
+
+
+class TestCsvListFields:
+    """Tests for comma-separated list settings."""
+
+    def test_comma_separated_strings_are_split(self) -> None:
+        settings = Settings(
+            cors_origins="https://a.example, https://b.example,",
+            webhook_allowed_domains=" hooks.example.com ,",
+        )
+        assert settings.cors_origins == ("https://a.example", "https://b.example")
+        assert settings.webhook_allowed_domains == ("hooks.example.com",)
+
+    def test_lists_pass_through(self) -> None:
+        settings = Settings(webhook_allowed_domains=["example.com"])
+        assert settings.webhook_allowed_domains == ("example.com",)
+
+
+class TestIsProduction:
+    """Tests for the derived is_production flag."""
+
+    def test_false_outside_production(self) -> None:
+        assert Settings(environment="development").is_production is False
+
+    def test_true_in_production(self) -> None:
+        settings = Settings(
+            environment="production",
+            session_secret_key="not-the-default",
+            auto_create_tables=False,
+            auth_disabled=False,
+            rate_limit_enabled=True,
+        )
+        assert settings.is_production is True
+
+    def test_tracks_environment_changes(self) -> None:
+        settings = Settings(environment="development")
+        settings.environment = "production"
+        assert settings.is_production is True
+
+    def test_cannot_be_set_independently(self) -> None:
+        assert Settings(environment="test", is_production=True).is_production is False
+
+
+class TestDatabaseUrl:
+    """Tests for the database URL the test run configures."""
+
+    def test_settings_use_test_database_url(self) -> None:
+        # conftest exports the (per-worker) URL before tessera is imported
+        assert config.settings.database_url == os.environ["DATABASE_URL"]
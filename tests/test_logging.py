@@ -1,9 +1,29 @@
 """Tests for structured logging configuration."""
 
+import io
 import json
 import logging
+import subprocess
+import sys
+import threading
 
-from tessera.logging import JSONFormatter, configure_logging
+import pytest
+
+import tessera.logging as tessera_logging
+from tessera.logging import JSONFormatter, JSONStreamHandler, configure_logging
+
+
+@pytest.fixture(autouse=True)
+def restore_logging_globals(monkeypatch: pytest.MonkeyPatch) -> None:
+    """configure_logging() turns off caller/thread lookup process-wide; undo it after each test."""
+    for name in ("_srcfile", "logThreads", "logProcesses", "logMultiprocessing"):
+        monkeypatch.setattr(logging, name, getattr(logging, name))
+
+
+def _terminal_handler() -> logging.Handler:
+    """The handler the queue listener writes through."""
+    assert tessera_logging._listener is not None
+    return tessera_logging._listener.handlers[0]
 
 
 class TestJSONFormatter:
@@ -53,6 +73,37 @@ class TestJSONFormatter:
         assert parsed["message"] == "something broke"
         assert "ValueError: test error" in parsed["exc_info"]
 
+    def test_reuses_cached_exception_text(self) -> None:
+        formatter = JSONFormatter()
+        try:
+            raise ValueError("test error")
+        except ValueError:
+            record = logging.LogRecord(
+                name="tessera.test",
+                level=logging.ERROR,
+                pathname="test.py",
+                lineno=1,
+                msg="something broke",
+                args=(),
+                exc_info=sys.exc_info(),
+            )
+        record.exc_text = "already formatted"
+        assert json.loads(formatter.format(record))["exc_info"] == "already formatted"
+
+    def test_format_line_is_newline_terminated_bytes(self) -> None:
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="tessera.test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="héllo",
+            args=(),
+            exc_info=None,
+        )
+        line = formatter.format_line(record)
+        assert line == formatter.format(record).encode() + b"\n"
+
     def test_output_is_single_line(self) -> None:
         formatter = JSONFormatter()
         record = logging.LogRecord(
@@ -68,6 +119,42 @@ class TestJSONFormatter:
         # JSON output should be a single line (no pretty printing)
         assert "\n" not in output
 
+    def test_timestamp_uses_record_created(self) -> None:
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="tessera.test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="at a fixed time",
+            args=(),
+            exc_info=None,
+        )
+        record.created = 1_700_000_000.25
+        parsed = json.loads(formatter.format(record))
+        assert parsed["timestamp"] == "2023-11-14T22:13:20.250Z"
+
+    def test_timestamp_tracks_second_changes(self) -> None:
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="tessera.test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="tick",
+            args=(),
+            exc_info=None,
+        )
+        timestamps = []
+        for created in (1_700_000_000.5, 1_700_000_000.75, 1_700_000_001.0):
+            record.created = created
+            timestamps.append(json.loads(formatter.format(record))["timestamp"])
+        assert timestamps == [
+            "2023-11-14T22:13:20.500Z",
+            "2023-11-14T22:13:20.750Z",
+            "2023-11-14T22:13:21.000Z",
+        ]
+
 
 class TestConfigureLogging:
     """Tests for the configure_logging function."""
@@ -77,14 +164,14 @@ class TestConfigureLogging:
         root = logging.getLogger()
         assert root.level == logging.DEBUG
         assert len(root.handlers) == 1
-        assert not isinstance(root.handlers[0].formatter, JSONFormatter)
+        assert not isinstance(_terminal_handler().formatter, JSONFormatter)
 
     def test_json_format(self) -> None:
         configure_logging(level="WARNING", fmt="json")
         root = logging.getLogger()
         assert root.level == logging.WARNING
         assert len(root.handlers) == 1
-        assert isinstance(root.handlers[0].formatter, JSONFormatter)
+        assert isinstance(_terminal_handler().formatter, JSONFormatter)
 
     def test_clears_existing_handlers(self) -> None:
         root = logging.getLogger()
@@ -94,3 +181,160 @@ class TestConfigureLogging:
 
         configure_logging(level="INFO", fmt="text")
         assert len(root.handlers) == 1
+
+    def test_handler_level_matches_root(self) -> None:
+        configure_logging(level="warning", fmt="text")
+        root = logging.getLogger()
+        assert root.level == logging.WARNING
+        assert root.handlers[0].level == logging.WARNING
+        assert _terminal_handler().level == logging.WARNING
+
+    def test_unknown_level_falls_back_to_info(self) -> None:
+        configure_logging(level="verbose", fmt="text")
+        assert logging.getLogger().level == logging.INFO
+
+    def test_quiets_third_party_loggers(self) -> None:
+        configure_logging(level="DEBUG", fmt="json")
+        handler = logging.getLogger().handlers[0]
+        for name in ("uvicorn.access", "httpx", "httpcore"):
+            quiet = logging.getLogger(name)
+            assert quiet.level == logging.WARNING
+            assert quiet.propagate is False
+            assert quiet.handlers == [handler]
+
+    def test_records_reach_terminal_handler_through_queue(self) -> None:
+        configure_logging(level="INFO", fmt="json")
+        stream = io.StringIO()
+        terminal = _terminal_handler()
+        assert isinstance(terminal, logging.StreamHandler)
+        terminal.setStream(stream)
+
+        try:
+            raise ValueError("queued error")
+        except ValueError:
+            logging.getLogger("tessera.test").exception("failed %s", "here")
+        tessera_logging._stop_listener()  # drains the queue
+        configure_logging(level="INFO", fmt="json")
+
+        parsed = json.loads(stream.getvalue())
+        assert parsed["message"] == "failed here"
+        assert "ValueError: queued error" in parsed["exc_info"]
+
+    def test_listener_survives_failed_write(self) -> None:
+        class FlakyStream(io.StringIO):
+            """Raises on the first write only, like a transient EAGAIN on stderr."""
+
+            def __init__(self) -> None:
+                super().__init__()
+                self.failed = threading.Event()
+
+            def write(self, text: str) -> int:
+                if not self.failed.is_set():
+                    self.failed.set()
+                    raise BlockingIOError("stream temporarily unavailable")
+                return super().write(text)
+
+        configure_logging(level="INFO", fmt="json")
+        stream = FlakyStream()
+        terminal = _terminal_handler()
+        assert isinstance(terminal, logging.StreamHandler)
+        terminal.setStream(stream)
+        logger = logging.getLogger("tessera.test")
+
+        logger.info("lost")
+        assert stream.failed.wait(timeout=5)
+        for i in range(3):
+            logger.info("after %d", i)
+        tessera_logging._stop_listener()  # drains the queue
+        configure_logging(level="INFO", fmt="json")
+
+        messages = [json.loads(line)["message"] for line in stream.getvalue().splitlines()]
+        assert messages == ["after 0", "after 1", "after 2"]
+
+    def test_reconfigure_stops_previous_listener(self) -> None:
+        configure_logging(level="INFO", fmt="text")
+        previous = tessera_logging._listener
+        assert previous is not None
+        configure_logging(level="INFO", fmt="text")
+        assert previous._thread is None
+        assert tessera_logging._listener is not previous
+
+    def test_skips_caller_lookup(self) -> None:
+        configure_logging(level="INFO", fmt="json")
+        record = logging.getLogger("tessera.test").makeRecord(
+            "tessera.test", logging.INFO, "(unknown file)", 0, "msg", (), None
+        )
+        assert logging._srcfile is None
+        assert record.thread is None
+        assert record.process is None
+
+
+class TestJSONStreamHandler:
+    """Tests for the binary-buffer JSON handler."""
+
+    def _record(self, level: int = logging.INFO) -> logging.LogRecord:
+        return logging.LogRecord(
+            name="tessera.test",
+            level=level,
+            pathname="test.py",
+            lineno=1,
+            msg="héllo",
+            args=(),
+            exc_info=None,
+        )
+
+    def test_writes_utf8_line_to_binary_buffer(self) -> None:
+        stream = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        handler = JSONStreamHandler(stream)
+        handler.setFormatter(JSONFormatter())
+        handler.emit(self._record())
+        handler.flush()
+
+        raw = stream.buffer.getvalue()
+        assert raw.endswith(b"\n")
+        assert json.loads(raw)["message"] == "héllo"
+
+    def test_falls_back_to_text_stream(self) -> None:
+        stream = io.StringIO()
+        handler = JSONStreamHandler(stream)
+        handler.setFormatter(JSONFormatter())
+        handler.emit(self._record())
+        handler.flush()
+
+        assert json.loads(stream.getvalue())["message"] == "héllo"
+
+    def test_batches_lines_until_flush(self) -> None:
+        stream = io.StringIO()
+        handler = JSONStreamHandler(stream)
+        handler.setFormatter(JSONFormatter())
+        handler.emit(self._record())
+        handler.emit(self._record())
+        assert stream.getvalue() == ""
+
+        handler.flush()
+        assert len(stream.getvalue().splitlines()) == 2
+
+    def test_error_records_are_written_immediately(self) -> None:
+        stream = io.StringIO()
+        handler = JSONStreamHandler(stream)
+        handler.setFormatter(JSONFormatter())
+        handler.emit(self._record())
+        handler.emit(self._record(logging.ERROR))
+
+        levels = [json.loads(line)["level"] for line in stream.getvalue().splitlines()]
+        assert levels == ["INFO", "ERROR"]
+
+    def test_configure_json_installs_handler(self) -> None:
+        configure_logging(level="INFO", fmt="json")
+        assert isinstance(_terminal_handler(), JSONStreamHandler)
+
+
+def test_import_quiets_third_party_loggers() -> None:
+    """Noisy loggers are quieted on import, before configure_logging() runs."""
+    code = (
+        "import logging, tessera.logging; "
+        "print([logging.getLogger(n).level for n in ('uvicorn.access', 'httpx', 'httpcore')])"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == str([logging.WARNING] * 3)
@@ -8,6 +8,7 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from tessera.api.rate_limit import parse_rate_limit
 from tessera.db.models import Base, TeamDB
 from tessera.main import app
 from tessera.models.api_key import APIKeyCreate
@@ -150,3 +151,16 @@ class TestRateLimiting:
         finally:
             app.dependency_overrides.clear()
             settings.rate_limit_enabled = original_rate_limit_enabled
+
+
+class TestParseRateLimit:
+    """Tests for cached rate limit string parsing."""
+
+    def test_parses_amount_and_window(self):
+        item = parse_rate_limit("30/minute")
+        assert item.amount == 30
+        assert item.get_expiry() == 60
+
+    def test_same_string_reuses_parsed_item(self):
+        assert parse_rate_limit("7/second") is parse_rate_limit("7/second")
+        assert parse_rate_limit("8/second").amount == 8
@@ -1,11 +1,19 @@
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
 from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
 
 import pytest
+import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import select, text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import Table, event, insert, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from tessera.db.models import AssetDB, Base, ContractDB, RegistrationDB, TeamDB
 from tessera.main import app
@@ -16,50 +24,94 @@ from tessera.services.batch import fetch_team_names
 
 TEST_DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
 _USE_SQLITE = TEST_DATABASE_URL.startswith("sqlite")
+# An in-memory database disappears with its engine's single connection
+_IN_MEMORY = _USE_SQLITE and ":memory:" in TEST_DATABASE_URL
 
+# Only ever checked for "is not None", so one timestamp serves every soft-deleted row
+_DELETED_TS = datetime.now(UTC)
 
-@pytest.fixture
-async def test_engine():
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
-    yield engine
-    await engine.dispose()
+# One engine and schema for the whole module; every test and fixture shares its event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
-@pytest.fixture
-async def session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    async with test_engine.begin() as conn:
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def test_engine() -> AsyncGenerator[AsyncEngine, None]:
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    if _USE_SQLITE:
+        # aiosqlite's implicit BEGIN handling breaks SAVEPOINTs; emit BEGIN ourselves
+        # (SQLAlchemy's documented recipe for SQLite transactional behaviour).
+        @event.listens_for(engine.sync_engine, "connect")
+        def _disable_driver_begin(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine.sync_engine, "begin")
+        def _emit_begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
         if not _USE_SQLITE:
             await conn.execute(text("CREATE SCHEMA IF NOT EXISTS core"))
             await conn.execute(text("CREATE SCHEMA IF NOT EXISTS workflow"))
             await conn.execute(text("CREATE SCHEMA IF NOT EXISTS audit"))
         await conn.run_sync(Base.metadata.create_all)
 
-    async_session = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
-    async with async_session() as session:
-        yield session
-        await session.rollback()
+    yield engine
+
+    if not _IN_MEMORY:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
 
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+@pytest_asyncio.fixture(loop_scope="module")
+async def session(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """Session bound to an outer transaction that is rolled back after the test.
+
+    Commits inside the test (or the app) only release a SAVEPOINT, so no test
+    sees another test's rows and no per-test DDL is needed.
+    """
+    async with test_engine.connect() as conn:
+        outer_txn = await conn.begin()
+        async_session = async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        async with async_session() as session:
+            yield session
+        await outer_txn.rollback()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_client() -> AsyncGenerator[AsyncClient, None]:
+    """One transport and client for the module; tests only swap the session override."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
 
 
-@pytest.fixture
-async def client(session) -> AsyncGenerator[AsyncClient, None]:
+@pytest.fixture(scope="module", autouse=True)
+def auth_enabled() -> Generator[None, None, None]:
+    """Every test here authenticates with real API keys; enable auth once for the module."""
     from tessera.config import settings
-    from tessera.db import database
 
-    original_auth_disabled = settings.auth_disabled
-    settings.auth_disabled = False
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "auth_disabled", False)
+        yield
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def client(session, shared_client: AsyncClient) -> AsyncGenerator[AsyncClient, None]:
+    from tessera.db import database
 
     async def get_test_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
     app.dependency_overrides[database.get_session] = get_test_session
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        yield client
+    yield shared_client
 
+    shared_client.cookies.clear()
     app.dependency_overrides.clear()
-    settings.auth_disabled = original_auth_disabled
 
 
 async def create_team_and_key(session: AsyncSession, name: str, scopes: list[APIKeyScope]):
@@ -72,7 +124,46 @@ async def create_team_and_key(session: AsyncSession, name: str, scopes: list[API
     return team, api_key.key
 
 
-@pytest.mark.asyncio
+async def create_teams_and_keys(
+    session: AsyncSession, specs: list[tuple[str, list[APIKeyScope]]]
+) -> list[tuple[TeamDB, str]]:
+    """Create several teams in one flush, then one API key each via create_api_key."""
+    teams = [TeamDB(name=name) for name, _ in specs]
+    session.add_all(teams)
+    await session.flush()
+
+    created = []
+    for team, (name, scopes) in zip(teams, specs, strict=True):
+        key_data = APIKeyCreate(name=f"{name}-key", team_id=team.id, scopes=scopes)
+        api_key = await create_api_key(session, key_data)
+        created.append((team, api_key.key))
+    return created
+
+
+async def bulk_insert(
+    session: AsyncSession, table: Table, rows: list[dict[str, Any]]
+) -> list[UUID]:
+    """Insert rows with one Core INSERT ... RETURNING, skipping the ORM unit of work.
+
+    Returns the new ids; use it for setup rows whose ORM instance isn't needed later.
+    Every row must carry the same keys: a multi-row VALUES takes its columns from
+    the first row.
+    """
+    result = await session.execute(insert(table).values(rows).returning(table.c.id))
+    return list(result.scalars())
+
+
+async def assert_soft_deleted(
+    session: AsyncSession, client: AsyncClient, obj: AssetDB | TeamDB, url: str, key: str
+) -> None:
+    """The row is hidden from GET by ID but still in the DB with deleted_at set."""
+    response = await client.get(url, headers={"Authorization": f"Bearer {key}"})
+    assert response.status_code == 404
+
+    await session.refresh(obj)
+    assert obj.deleted_at is not None
+
+
 async def test_soft_delete_asset(session: AsyncSession, client: AsyncClient):
     # 1. Create a team and asset
     team, key = await create_team_and_key(
@@ -103,29 +194,22 @@ async def test_soft_delete_asset(session: AsyncSession, client: AsyncClient):
     assert response.status_code == 200
     assert response.json()["total"] == 0
 
-    # 5. Verify it's hidden from GET by ID
-    response = await client.get(
-        f"/api/v1/assets/{asset_id}", headers={"Authorization": f"Bearer {key}"}
-    )
-    assert response.status_code == 404
+    # 5. Verify it's hidden from GET by ID but still in the DB with deleted_at set
+    await assert_soft_deleted(session, client, asset, f"/api/v1/assets/{asset_id}", key)
 
-    # 6. Verify it's still in the DB but with deleted_at set
-    result = await session.execute(select(AssetDB).where(AssetDB.id == asset_id))
-    db_asset = result.scalar_one()
-    assert db_asset.deleted_at is not None
 
-
-@pytest.mark.asyncio
 async def test_restore_asset(session: AsyncSession, client: AsyncClient):
     # 1. Create and soft-delete an asset
-    admin_team, admin_key = await create_team_and_key(session, "admin", [APIKeyScope.ADMIN])
-    team, key = await create_team_and_key(session, "user", [APIKeyScope.READ, APIKeyScope.WRITE])
+    (admin_team, admin_key), (team, key) = await create_teams_and_keys(
+        session,
+        [("admin", [APIKeyScope.ADMIN]), ("user", [APIKeyScope.READ, APIKeyScope.WRITE])],
+    )
 
     asset = AssetDB(
         fqn="restore.me",
         owner_team_id=team.id,
         environment="production",
-        deleted_at=datetime.now(UTC),
+        deleted_at=_DELETED_TS,
     )
     session.add(asset)
     await session.commit()
@@ -145,16 +229,15 @@ async def test_restore_asset(session: AsyncSession, client: AsyncClient):
     assert response.status_code == 200
 
     # 4. Verify deleted_at is None in DB
-    result = await session.execute(select(AssetDB).where(AssetDB.id == asset_id))
-    db_asset = result.scalar_one()
-    assert db_asset.deleted_at is None
+    await session.refresh(asset)
+    assert asset.deleted_at is None
 
 
-@pytest.mark.asyncio
 async def test_soft_delete_team(session: AsyncSession, client: AsyncClient):
     # 1. Create a team
-    admin_team, admin_key = await create_team_and_key(session, "admin", [APIKeyScope.ADMIN])
-    team, _ = await create_team_and_key(session, "delete-me-team", [APIKeyScope.READ])
+    (admin_team, admin_key), (team, _) = await create_teams_and_keys(
+        session, [("admin", [APIKeyScope.ADMIN]), ("delete-me-team", [APIKeyScope.READ])]
+    )
     team_id = team.id
 
     # 2. Delete the team (admin only)
@@ -169,19 +252,15 @@ async def test_soft_delete_team(session: AsyncSession, client: AsyncClient):
     teams = response.json()["results"]
     assert not any(t["id"] == str(team_id) for t in teams)
 
-    # 4. Verify it's hidden from GET by ID
-    response = await client.get(
-        f"/api/v1/teams/{team_id}", headers={"Authorization": f"Bearer {admin_key}"}
-    )
-    assert response.status_code == 404
+    # 4. Verify it's hidden from GET by ID but still in the DB with deleted_at set
+    await assert_soft_deleted(session, client, team, f"/api/v1/teams/{team_id}", admin_key)
 
 
-@pytest.mark.asyncio
 async def test_restore_team(session: AsyncSession, client: AsyncClient):
     # 1. Create and soft-delete a team
     admin_team, admin_key = await create_team_and_key(session, "admin", [APIKeyScope.ADMIN])
 
-    team = TeamDB(name="Restore Team", deleted_at=datetime.now(UTC))
+    team = TeamDB(name="Restore Team", deleted_at=_DELETED_TS)
     session.add(team)
     await session.commit()
     team_id = team.id
@@ -199,11 +278,10 @@ async def test_restore_team(session: AsyncSession, client: AsyncClient):
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
 async def test_fetch_team_names_excludes_deleted(session: AsyncSession):
     """fetch_team_names should not return soft-deleted teams."""
     team_active = TeamDB(name="active-team")
-    team_deleted = TeamDB(name="deleted-team", deleted_at=datetime.now(UTC))
+    team_deleted = TeamDB(name="deleted-team", deleted_at=_DELETED_TS)
     session.add_all([team_active, team_deleted])
     await session.flush()
 
@@ -213,75 +291,84 @@ async def test_fetch_team_names_excludes_deleted(session: AsyncSession):
     assert names[team_active.id] == "active-team"
 
 
-@pytest.mark.asyncio
 async def test_lineage_excludes_deleted_asset(session: AsyncSession, client: AsyncClient):
     """Lineage endpoint should return 404 for soft-deleted assets."""
     team, key = await create_team_and_key(
         session, "lineage-team", [APIKeyScope.READ, APIKeyScope.WRITE]
     )
-    asset = AssetDB(
-        fqn="lineage.deleted",
-        owner_team_id=team.id,
-        environment="production",
-        deleted_at=datetime.now(UTC),
+    (asset_id,) = await bulk_insert(
+        session,
+        AssetDB.__table__,
+        [
+            {
+                "fqn": "lineage.deleted",
+                "owner_team_id": team.id,
+                "environment": "production",
+                "deleted_at": _DELETED_TS,
+            }
+        ],
     )
-    session.add(asset)
-    await session.flush()
 
     response = await client.get(
-        f"/api/v1/assets/{asset.id}/lineage",
+        f"/api/v1/assets/{asset_id}/lineage",
         headers={"Authorization": f"Bearer {key}"},
     )
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_lineage_excludes_deleted_registrations(session: AsyncSession, client: AsyncClient):
     """Lineage downstream should not include soft-deleted registrations."""
     team, key = await create_team_and_key(
         session, "lineage-reg-team", [APIKeyScope.READ, APIKeyScope.WRITE]
     )
-    consumer_team = TeamDB(name="consumer-team")
-    session.add(consumer_team)
-    await session.flush()
-
-    asset = AssetDB(fqn="lineage.reg.test", owner_team_id=team.id, environment="production")
-    session.add(asset)
-    await session.flush()
-
-    contract = ContractDB(
-        asset_id=asset.id,
-        version="1.0.0",
-        schema_def={"type": "object"},
-        compatibility_mode="backward",
-        status=ContractStatus.ACTIVE,
-        published_by=team.id,
+    (consumer_team_id,) = await bulk_insert(session, TeamDB.__table__, [{"name": "consumer-team"}])
+    (asset_id,) = await bulk_insert(
+        session,
+        AssetDB.__table__,
+        [{"fqn": "lineage.reg.test", "owner_team_id": team.id, "environment": "production"}],
+    )
+    (contract_id,) = await bulk_insert(
+        session,
+        ContractDB.__table__,
+        [
+            {
+                "asset_id": asset_id,
+                "version": "1.0.0",
+                "schema": {"type": "object"},
+                "compatibility_mode": "backward",
+                "status": ContractStatus.ACTIVE,
+                "published_by": team.id,
+            }
+        ],
     )
-    session.add(contract)
-    await session.flush()
 
     # Create one active and one deleted registration
-    reg_active = RegistrationDB(
-        contract_id=contract.id,
-        consumer_team_id=consumer_team.id,
-        status=RegistrationStatus.ACTIVE,
-    )
-    reg_deleted = RegistrationDB(
-        contract_id=contract.id,
-        consumer_team_id=team.id,
-        status=RegistrationStatus.ACTIVE,
-        deleted_at=datetime.now(UTC),
+    await bulk_insert(
+        session,
+        RegistrationDB.__table__,
+        [
+            {
+                "contract_id": contract_id,
+                "consumer_team_id": consumer_team_id,
+                "status": RegistrationStatus.ACTIVE,
+                "deleted_at": None,
+            },
+            {
+                "contract_id": contract_id,
+                "consumer_team_id": team.id,
+                "status": RegistrationStatus.ACTIVE,
+                "deleted_at": _DELETED_TS,
+            },
+        ],
     )
-    session.add_all([reg_active, reg_deleted])
-    await session.flush()
 
     response = await client.get(
-        f"/api/v1/assets/{asset.id}/lineage",
+        f"/api/v1/assets/{asset_id}/lineage",
         headers={"Authorization": f"Bearer {key}"},
     )
     assert response.status_code == 200
     data = response.json()
     # Only the active registration should appear in downstream
     downstream_team_ids = [d["team_id"] for d in data.get("downstream", [])]
-    assert str(consumer_team.id) in downstream_team_ids
+    assert str(consumer_team_id) in downstream_team_ids
     assert str(team.id) not in downstream_team_ids